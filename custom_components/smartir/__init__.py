@@ -2,77 +2,104 @@
 
 import logging
 import os.path
-import json
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+_COMPONENT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Custom device files directories already created
+_DIR_CHECKED = set()
+
 
 class DeviceData:
     @staticmethod
     async def load_file(device_code, device_class, required_keys, hass):
         """Load device JSON file."""
+        device_data, _ = await hass.async_add_executor_job(
+            DeviceData.read_device_file, device_code, device_class, required_keys
+        )
+        return device_data
+
+    @staticmethod
+    def read_device_file(device_code, device_class, required_keys, cached=None):
+        """Find, read and validate device JSON file, blocking.
+
+        Returns the device data together with the (path, mtime, size) signature
+        of the file it was read from. When the file to load still matches the
+        signature of the optional (signature, device_data) cached pair, the
+        cached device data is returned without reading the file again.
+        """
         device_json_filename = str(device_code) + ".json"
 
-        device_files_subdir = os.path.join("custom_codes", device_class)
-        device_files_absdir = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), device_files_subdir
-        )
-        if os.path.isdir(device_files_absdir):
-            device_json_path = os.path.join(device_files_absdir, device_json_filename)
-            if os.path.exists(device_json_path):
-                _LOGGER.debug(
-                    "Loading custom device Json file '%s'.", device_json_filename
-                )
-                if device_data := await DeviceData.check_file(
-                    device_json_filename, device_json_path, required_keys, hass
-                ):
-                    return device_data
-        else:
-            os.makedirs(device_files_absdir)
+        device_files_absdir = os.path.join(_COMPONENT_DIR, "custom_codes", device_class)
+        if device_files_absdir not in _DIR_CHECKED:
+            os.makedirs(device_files_absdir, exist_ok=True)
+            _DIR_CHECKED.add(device_files_absdir)
 
-        device_files_subdir = os.path.join("codes", device_class)
-        device_files_absdir = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)), device_files_subdir
-        )
+        device_json_path = os.path.join(device_files_absdir, device_json_filename)
+        if signature := DeviceData.file_signature(device_json_path):
+            if cached is not None and cached[0] == signature:
+                return cached[1], signature
+            _LOGGER.debug("Loading custom device Json file '%s'.", device_json_filename)
+            if device_data := DeviceData.check_file(
+                device_json_filename, device_json_path, required_keys
+            ):
+                return device_data, signature
+
+        device_files_absdir = os.path.join(_COMPONENT_DIR, "codes", device_class)
         if os.path.isdir(device_files_absdir):
             device_json_path = os.path.join(device_files_absdir, device_json_filename)
-            if os.path.exists(device_json_path):
+            if signature := DeviceData.file_signature(device_json_path):
+                if cached is not None and cached[0] == signature:
+                    return cached[1], signature
                 _LOGGER.debug("Loading device Json file '%s'.", device_json_filename)
-                if device_data := await DeviceData.check_file(
-                    device_json_filename, device_json_path, required_keys, hass
+                if device_data := DeviceData.check_file(
+                    device_json_filename, device_json_path, required_keys
                 ):
-                    return device_data
+                    return device_data, signature
             else:
                 _LOGGER.error(
                     "Device Json file '%s' doesn't exists!", device_json_filename
                 )
-                return None
+                return None, None
         else:
             _LOGGER.error(
                 "Devices Json files directory '%s' doesn't exists!", device_files_absdir
             )
-            return None
+            return None, None
 
-        return None
+        return None, None
+
+    @staticmethod
+    def file_signature(file_path):
+        """Return (path, mtime, size) of an existing file or None, blocking."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, stat.st_mtime, stat.st_size)
 
     @staticmethod
     def read_file_as_json(file_path: str) -> dict:
         """Read a JSON file and return its content as a dictionary."""
-        with open(file_path, "r") as file:
+        with open(file_path, "rb") as file:
             try:
-                _LOGGER.debug(f"Loading JSON file {file_path}")
-                data = json.load(file)
-                _LOGGER.debug(f"{file_path} file loaded")
+                _LOGGER.debug("Loading JSON file %s", file_path)
+                data = json_loads(file.read())
+                _LOGGER.debug("%s file loaded", file_path)
                 return data
             except Exception as e:
-                _LOGGER.error(f"The device JSON file is invalid: {e}")
+                _LOGGER.error("The device JSON file is invalid: %s", e)
                 return None
 
     @staticmethod
-    async def check_file(device_json_filename, device_json_path, required_keys, hass):
-        device_data = await hass.async_add_executor_job(
-            DeviceData.read_file_as_json, device_json_path
-        )
+    def check_file(device_json_filename, device_json_path, required_keys):
+        device_data = DeviceData.read_file_as_json(device_json_path)
 
         if not isinstance(device_data, dict):
             _LOGGER.error("Invalid device code file '%s.", device_json_filename)
@@ -1,5 +1,7 @@
 import asyncio
 import logging
+from types import MappingProxyType
+from weakref import WeakValueDictionary
 
 import voluptuous as vol
 
@@ -16,10 +18,6 @@ from homeassistant.helpers.event import async_track_state_change_event, async_ca
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
-)
 from . import DeviceData
 from .controller import get_controller
 
@@ -39,6 +37,63 @@ CONF_POWER_SENSOR_RESTORE_STATE = "power_sensor_restore_state"
 
 OSCILLATING = "oscillate"
 
+
+class _SharedDeviceData(dict):
+    """Device data shared by all fans using the same device code."""
+
+    __slots__ = (
+        "__weakref__",
+        "signature",
+        "static_attrs",
+        "cmd_table",
+        "support_flags",
+        "speed_to_pct",
+        "pct_bounds",
+    )
+
+    def build_command_table(self):
+        """Build the command lookup table and supported features in one pass."""
+        # flat (speed, direction, oscillate) -> command lookup table
+        cmd_table = {}
+        has_forward = has_reverse = has_oscillate = False
+        for key, value in self["commands"].items():
+            if key == "off":
+                cmd_table[("off", "", False)] = value
+            elif key == OSCILLATING:
+                has_oscillate = True
+                for speed in self["speed"]:
+                    cmd_table[(speed, "", True)] = value
+            else:
+                has_forward = has_forward or key == DIRECTION_FORWARD
+                has_reverse = has_reverse or key == DIRECTION_REVERSE
+                if isinstance(value, dict):
+                    for speed, command in value.items():
+                        cmd_table[(speed, key, False)] = command
+
+        self.cmd_table = cmd_table
+        self.support_flags = (
+            FanEntityFeature.SET_SPEED
+            | (FanEntityFeature.DIRECTION if has_forward and has_reverse else 0)
+            | (FanEntityFeature.OSCILLATE if has_oscillate else 0)
+        )
+
+    def build_speed_maps(self):
+        """Build the speed <-> percentage maps, same rounding as HA helpers."""
+        speed_count = len(self["speed"])
+        self.speed_to_pct = {
+            speed: (index + 1) * 100 // speed_count
+            for index, speed in enumerate(self["speed"])
+        }
+        self.pct_bounds = sorted(
+            (pct, speed) for speed, pct in self.speed_to_pct.items()
+        )
+
+
+# plain dicts can't be weak referenced, hence the dict subclass above
+_DEVICE_DATA_BY_CODE: "WeakValueDictionary[int, _SharedDeviceData]" = (
+    WeakValueDictionary()
+)
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
         vol.Optional(CONF_UNIQUE_ID): cv.string,
@@ -60,24 +115,44 @@ async def async_setup_platform(
 ):
     """Set up the IR Fan platform."""
     _LOGGER.debug("Setting up the SmartIR fan platform")
-    if not (
-        device_data := await DeviceData.load_file(
-            config.get(CONF_DEVICE_CODE),
-            "fan",
-            [
-                "manufacturer",
-                "supportedModels",
-                "supportedController",
-                "commandsEncoding",
-                "speed",
-            ],
-            hass,
-        )
-    ):
+    device_code = config.get(CONF_DEVICE_CODE)
+
+    # reuse the data of already set up fans unless the device file changed
+    shared_data = _DEVICE_DATA_BY_CODE.get(device_code)
+    device_data, signature = await hass.async_add_executor_job(
+        DeviceData.read_device_file,
+        device_code,
+        "fan",
+        [
+            "manufacturer",
+            "supportedModels",
+            "supportedController",
+            "commandsEncoding",
+            "speed",
+        ],
+        None if shared_data is None else (shared_data.signature, shared_data),
+    )
+    if not device_data:
         _LOGGER.error("SmartIR fan device data init failed!")
         return
 
-    async_add_entities([SmartIRFan(hass, config, device_data)])
+    if device_data is not shared_data:
+        shared_data = _SharedDeviceData(device_data)
+        shared_data.signature = signature
+        shared_data.static_attrs = MappingProxyType(
+            {
+                "device_code": device_code,
+                "manufacturer": shared_data["manufacturer"],
+                "supported_models": shared_data["supportedModels"],
+                "supported_controller": shared_data["supportedController"],
+                "commands_encoding": shared_data["commandsEncoding"],
+            }
+        )
+        shared_data.build_command_table()
+        shared_data.build_speed_maps()
+        _DEVICE_DATA_BY_CODE[device_code] = shared_data
+
+    async_add_entities([SmartIRFan(hass, config, shared_data)])
 
 
 class SmartIRFan(FanEntity, RestoreEntity):
@@ -87,7 +162,6 @@ class SmartIRFan(FanEntity, RestoreEntity):
         self.hass = hass
         self._unique_id = config.get(CONF_UNIQUE_ID)
         self._name = config.get(CONF_NAME)
-        self._device_code = config.get(CONF_DEVICE_CODE)
         self._controller_data = config.get(CONF_CONTROLLER_DATA)
         self._delay = config.get(CONF_DELAY)
         self._power_sensor = config.get(CONF_POWER_SENSOR)
@@ -98,37 +172,32 @@ class SmartIRFan(FanEntity, RestoreEntity):
         self._speed = None
         self._oscillating = None
         self._on_by_remote = False
-        self._support_flags = FanEntityFeature.SET_SPEED
         self._power_sensor_check_expect = None
         self._power_sensor_check_cancel = None
 
-        self._manufacturer = device_data["manufacturer"]
-        self._supported_models = device_data["supportedModels"]
-        self._supported_controller = device_data["supportedController"]
-        self._commands_encoding = device_data["commandsEncoding"]
-        self._commands = device_data["commands"]
+        self._device_data = device_data
 
         # fan speeds
-        self._speed_list = device_data["speed"]
         if not self._speed_list:
             _LOGGER.error("Speed shall have at least one valid speed defined!")
             return
         self._speed = self._speed_list[0]
 
         # fan direction
-        if DIRECTION_REVERSE in self._commands and DIRECTION_FORWARD in self._commands:
+        if self._support_flags & FanEntityFeature.DIRECTION:
             self._current_direction = DIRECTION_FORWARD
-            self._support_flags = self._support_flags | FanEntityFeature.DIRECTION
         else:
             self._current_direction = "default"
 
         # fan oscillation
-        if OSCILLATING in self._commands:
+        if self._support_flags & FanEntityFeature.OSCILLATE:
             self._oscillating = False
-            self._support_flags = self._support_flags | FanEntityFeature.OSCILLATE
 
-        # Init exclusive lock for sending IR commands
-        self._temp_lock = asyncio.Lock()
+        # Future of the last queued IR command, each send waits for its predecessor
+        self._sending = None
+
+        # State writes are coalesced to one per event loop iteration
+        self._write_scheduled = False
 
         # Init the IR/RF controller
         self._controller = get_controller(
@@ -148,11 +217,12 @@ class SmartIRFan(FanEntity, RestoreEntity):
         if last_state is not None:
             self._state = last_state.state
 
+            last_speed = last_state.attributes.get("speed")
             if (
                 self._support_flags & FanEntityFeature.SET_SPEED
-                and last_state.attributes.get("speed") in self._speed_list
+                and last_speed in self._speed_to_pct
             ):
-                self._speed = last_state.attributes.get("speed")
+                self._speed = last_speed
 
             if self._support_flags & FanEntityFeature.DIRECTION:
                 self._current_direction = last_state.attributes.get(
@@ -170,6 +240,34 @@ class SmartIRFan(FanEntity, RestoreEntity):
                 self.hass, self._power_sensor, self._async_power_sensor_changed
             )
 
+    @property
+    def _supported_controller(self):
+        return self._device_data["supportedController"]
+
+    @property
+    def _commands_encoding(self):
+        return self._device_data["commandsEncoding"]
+
+    @property
+    def _speed_list(self):
+        return self._device_data["speed"]
+
+    @property
+    def _speed_to_pct(self):
+        return self._device_data.speed_to_pct
+
+    @property
+    def _pct_bounds(self):
+        return self._device_data.pct_bounds
+
+    @property
+    def _cmd_table(self):
+        return self._device_data.cmd_table
+
+    @property
+    def _support_flags(self):
+        return self._device_data.support_flags
+
     @property
     def unique_id(self):
         """Return a unique ID."""
@@ -193,7 +291,7 @@ class SmartIRFan(FanEntity, RestoreEntity):
         elif self._state == STATE_OFF:
             return 0
         else:
-            return ordered_list_item_to_percentage(self._speed_list, self._speed)
+            return self._speed_to_pct[self._speed]
 
     @property
     def speed_count(self):
@@ -227,103 +325,116 @@ class SmartIRFan(FanEntity, RestoreEntity):
         return {
             "speed": self._speed,
             "on_by_remote": self._on_by_remote,
-            "device_code": self._device_code,
-            "manufacturer": self._manufacturer,
-            "supported_models": self._supported_models,
-            "supported_controller": self._supported_controller,
-            "commands_encoding": self._commands_encoding,
+            **self._device_data.static_attrs,
         }
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the desired speed for the fan."""
         if percentage == 0:
-            state = STATE_OFF
-            speed = self._speed
+            await self._send_command(state=STATE_OFF)
         else:
-            state = STATE_ON
-            speed = percentage_to_ordered_list_item(self._speed_list, percentage)
-
-        await self._send_command(
-            state, speed, self._current_direction, self._oscillating
-        )
+            await self._send_command(
+                state=STATE_ON, speed=self._percentage_to_speed(percentage)
+            )
 
     async def async_oscillate(self, oscillating: bool) -> None:
         """Set oscillation of the fan."""
         if not self._support_flags & FanEntityFeature.OSCILLATE:
             return
 
-        await self._send_command(
-            self._state, self._speed, self._current_direction, oscillating
-        )
+        await self._send_command(oscillate=oscillating)
 
     async def async_set_direction(self, direction: str):
         """Set the direction of the fan"""
         if not self._support_flags & FanEntityFeature.DIRECTION:
             return
 
-        await self._send_command(self._state, self._speed, direction, self._oscillating)
+        await self._send_command(direction=direction)
 
     async def async_turn_on(
         self, percentage: int = None, preset_mode: str = None, **kwargs
     ):
         """Turn on the fan."""
         if percentage is None:
-            percentage = ordered_list_item_to_percentage(self._speed_list, self._speed)
-
-        await self.async_set_percentage(percentage)
+            await self._send_command(state=STATE_ON)
+        else:
+            await self.async_set_percentage(percentage)
 
     async def async_turn_off(self):
         """Turn off the fan."""
         await self.async_set_percentage(0)
 
-    async def _send_command(self, state, speed, direction, oscillate):
-        async with self._temp_lock:
+    def _percentage_to_speed(self, percentage):
+        """Return the lowest speed covering the given percentage."""
+        for upper_bound, speed in self._pct_bounds:
+            if percentage <= upper_bound:
+                return speed
+        return self._pct_bounds[-1][1]
+
+    async def _send_command(
+        self, state=None, speed=None, direction=None, oscillate=None
+    ):
+        """Send the IR command, values left as None are kept as they are."""
+        previous = self._sending
+        self._sending = sending = self.hass.loop.create_future()
+        try:
+            if previous is not None:
+                await asyncio.shield(previous)
+
+            # resolve against the state left by any previously sent command
+            state = self._state if state is None else state
+            speed = self._speed if speed is None else speed
+            direction = self._current_direction if direction is None else direction
+            oscillate = self._oscillating if oscillate is None else oscillate
+
+            if not self._on_by_remote and (state, speed, direction, oscillate) == (
+                self._state,
+                self._speed,
+                self._current_direction,
+                self._oscillating,
+            ):
+                return
 
             if self._power_sensor and self._state != state:
                 self._async_power_sensor_check_schedule(state)
 
+            if state == STATE_OFF:
+                key = ("off", "", False)
+            elif oscillate:
+                key = (speed, "", True)
+            else:
+                key = (speed, direction, False)
+
+            if (command := self._cmd_table.get(key)) is None:
+                _LOGGER.error(
+                    "Missing device IR code for state '%s' direction '%s' speed '%s' oscillate '%s'.",
+                    state,
+                    direction,
+                    speed,
+                    oscillate,
+                )
+                return
+
             try:
-                if state == STATE_OFF:
-                    if "off" in self._commands:
-                        await self._controller.send(self._commands["off"])
-                    else:
-                        _LOGGER.error("Missing device IR code for 'off' mode.")
-                        return
-                else:
-                    if oscillate:
-                        if "oscillate" in self._commands:
-                            await self._controller.send(self._commands["oscillate"])
-                        else:
-                            _LOGGER.error(
-                                "Missing device IR code for 'oscillate' mode."
-                            )
-                            return
-                    else:
-                        if (
-                            direction in self._commands
-                            and isinstance(self._commands[direction], dict)
-                            and speed in self._commands[direction]
-                        ):
-                            await self._controller.send(
-                                self._commands[direction][speed]
-                            )
-                        else:
-                            _LOGGER.error(
-                                "Missing device IR code for direction '%s' speed '%s'.",
-                                direction,
-                                speed,
-                            )
-                            return
+                await self._controller.send(command)
 
                 self._state = state
                 self._speed = speed
                 self._on_by_remote = False
                 self._current_direction = direction
                 self._oscillating = oscillate
-                self.async_write_ha_state()
+                self._schedule_write()
 
             except Exception as e:
                 _LOGGER.exception(e)
+        finally:
+            if previous is None or previous.done():
+                sending.set_result(None)
+            else:
+                # cancelled while waiting, keep the successor behind previous
+                previous.add_done_callback(lambda _: sending.set_result(None))
+            if self._sending is sending:
+                self._sending = None
 
     async def _async_power_sensor_changed(
         self, event: Event[EventStateChangedData]
@@ -331,7 +442,7 @@ class SmartIRFan(FanEntity, RestoreEntity):
         """Handle power sensor changes."""
         old_state = event.data["old_state"]
         new_state = event.data["new_state"]
-        if new_state is None:
+        if new_state is None or new_state.state not in (STATE_ON, STATE_OFF):
             return
 
         if old_state is not None and new_state.state == old_state.state:
@@ -344,6 +455,18 @@ class SmartIRFan(FanEntity, RestoreEntity):
             self._on_by_remote = False
             if self._state == STATE_ON:
                 self._state = STATE_OFF
+        self._schedule_write()
+
+    @callback
+    def _schedule_write(self):
+        """Schedule a single state write for the current loop iteration."""
+        if not self._write_scheduled:
+            self._write_scheduled = True
+            self.hass.loop.call_soon(self._do_write)
+
+    @callback
+    def _do_write(self):
+        self._write_scheduled = False
         self.async_write_ha_state()
 
     @callback
@@ -377,7 +500,7 @@ class SmartIRFan(FanEntity, RestoreEntity):
                     "Power sensor check failed, reverted device state to '%s'.",
                     self._state,
                 )
-                self.async_write_ha_state()
+                self._schedule_write()
 
         self._power_sensor_check_expect = state
         self._power_sensor_check_cancel = async_call_later(